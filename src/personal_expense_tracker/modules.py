@@ -23,7 +23,7 @@ Features:
 
 Dependencies:
     - datetime (built-in): For parsing and handling dates.
-    - collections.defaultdict (built-in): For grouping expenses into reports.
+    - itertools.groupby (built-in): For grouping expenses into reports.
     - pathlib.Path (built-in): For file and directory handling.
     - tabulate (external): For pretty-printing tables.
     - json (built-in): For reading/writing expense data in JSON format.
@@ -70,15 +70,55 @@ Notes:
 """
 
 
-from datetime import datetime
-from collections import defaultdict
+from datetime import date
+from calendar import month_name
+from functools import lru_cache
+from itertools import groupby
+from math import isfinite
+from operator import itemgetter
 from pathlib import Path
 from tabulate import tabulate
 import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# C-level JSON encode/decode when orjson is available, stdlib json otherwise.
+_json_loads = orjson.loads if orjson else json.loads
+if orjson:
+    def _json_dumps(data: dict) -> str:
+        return orjson.dumps(data).decode("utf-8")
+else:
+    _json_dumps = json.dumps
 
 
 _file = Path("./src/personal_expense_tracker/files/expense.txt")
 
+# In-memory cache of loaded expense files, keyed by (path, mtime_ns, size).
+# A stale key simply misses, so external edits to the file are picked up too.
+_CACHE = {}
+
+# Cache of date-sorted views of the loaded data, keyed like _CACHE plus the
+# sort direction, so every report type in a session shares one sort pass.
+_SORTED_CACHE = {}
+
+# Cache of generated report results, keyed by (path, report type, params,
+# mtime_ns, size), so re-asking for the same period is a dict lookup.
+_REPORT_CACHE = {}
+
+# Lowercased month name -> month number, built once for O(1) lookups.
+_MONTHS = {name.lower(): i for i, name in enumerate(month_name) if name}
+
+# Directories already created this session; lets _ensure_dir_helper skip
+# the mkdir syscall on every save.
+_ENSURED_DIRS = set()
+
+# [today's date, its ISO string], refreshed lazily by _today_iso_helper.
+_TODAY_CACHE = [None, None]
+
 # ----------------------------
 # Helper section..............
 # ----------------------------
@@ -91,10 +131,27 @@ def _ensure_dir_helper(path: Path) -> Path:
 
     Returns:
         Path: The original directory path.
+
+    Notes:
+        Directories already ensured this session are remembered, so repeat
+        calls skip the mkdir syscall.
     """
-    path.mkdir(parents=True, exist_ok=True)
+    if str(path) not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(str(path))
     return path
 
+def _invalidate_cache_helper(file: Path) -> None:
+    """
+    Evict every cached view of the given file after a write.
+
+    Args:
+        file (Path): File path whose cached loads and sorts are now stale.
+    """
+    for cache in (_CACHE, _SORTED_CACHE, _REPORT_CACHE):
+        for key in [k for k in cache if k[0] == str(file)]:
+            del cache[key]
+
 def _file_saving_helper(data: dict, file: Path = _file, line_number: int = None) -> None:
     """
     Save or update an expense record in a line-based JSON file.
@@ -112,17 +169,86 @@ def _file_saving_helper(data: dict, file: Path = _file, line_number: int = None)
     """
     _ensure_dir_helper(file.parent)
 
+    # Strip internal fields (e.g. the cached '_dt' date) before persisting.
+    data = {k: v for k, v in data.items() if not k.startswith("_")}
+
     if line_number is None:
         # Append mode
         with file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(data) + "\n")
+            f.write(_json_dumps(data) + "\n")
     else:
-        # Update mode
-        lines = file.read_text(encoding="utf-8").splitlines()
-        lines[line_number - 1] = json.dumps(data)
-        file.write_text("\n".join(lines)+"\n", encoding="utf-8")
+        # Update mode: if the re-encoded line has the same byte length as the
+        # one it replaces, overwrite it in place with a single seek + write.
+        new_line = (_json_dumps(data) + "\n").encode("utf-8")
+        in_place = False
+        with file.open("r+b") as f:
+            offset = 0
+            for _ in range(line_number - 1):
+                skipped = f.readline()
+                if not skipped:
+                    break
+                offset += len(skipped)
+            old_line = f.readline()
+            if old_line and len(old_line) == len(new_line):
+                f.seek(offset)
+                f.write(new_line)
+                in_place = True
+
+        if not in_place:
+            # Lengths differ: stream line-by-line into a temp file,
+            # substituting the target line, instead of materializing the
+            # whole file in memory.
+            tmp = file.with_suffix(file.suffix + ".tmp")
+            with file.open("r", encoding="utf-8") as src, tmp.open("w", encoding="utf-8") as dst:
+                for number, line in enumerate(src, 1):
+                    if number == line_number:
+                        dst.write(_json_dumps(data) + "\n")
+                    else:
+                        dst.write(line if line.endswith("\n") else line + "\n")
+            os.replace(tmp, file)
         print('Data has been updated to the file...')
 
+    # Drop any cached view of this file; it is stale after a write.
+    _invalidate_cache_helper(file)
+
+def _batch_saving_helper(records: list[dict], file: Path = _file) -> None:
+    """
+    Append several expense records to the file with a single write.
+
+    Encodes every record up front and issues one buffered write instead of an
+    open/write/close cycle per record, which keeps syscall overhead constant
+    for bulk sessions.
+
+    Args:
+        records (list[dict]): Expense entries to append.
+        file (Path): File path to store expense data.
+    """
+    if not records:
+        return
+    _ensure_dir_helper(file.parent)
+    payload = "".join(
+        _json_dumps({k: v for k, v in rec.items() if not k.startswith("_")}) + "\n"
+        for rec in records
+    )
+    with file.open("a", encoding="utf-8") as f:
+        f.write(payload)
+    _invalidate_cache_helper(file)
+
+def _attach_date_fields_helper(rec: dict) -> dict:
+    """
+    Attach the internal precomputed date fields to a decoded record.
+
+    Args:
+        rec (dict): Decoded expense record with a 'date' key.
+
+    Returns:
+        dict: The same record with '_dt', '_ym', and '_week' set.
+    """
+    dt = rec["_dt"] = date.fromisoformat(rec["date"])
+    rec["_ym"] = (dt.year, dt.month)
+    rec["_week"] = dt.isocalendar()[1]
+    return rec
+
 def _loading_data_helper(file:Path = _file) -> list[dict]:
     """
     Load expense data from a file and return as a list of dictionaries.
@@ -132,25 +258,110 @@ def _loading_data_helper(file:Path = _file) -> list[dict]:
 
     Returns:
         list[dict]: List of expense dictionaries. Returns empty list if file does not exist.
+
+    Notes:
+        Each record gets internal fields computed once at load time: '_dt'
+        (the parsed `datetime.date`), '_ym' ((year, month) tuple), and
+        '_week' (ISO week number), so downstream sorting/filtering never
+        re-derives them.
+        Results are cached per (path, mtime, size), so repeated calls within
+        one session only hit the disk when the file has actually changed.
     """
-    if not Path(file).exists():
+    file = Path(file)
+    try:
+        st = file.stat()
+    except OSError:
         return []
-    with open(file, "r", encoding="utf-8") as f:
-        return [json.loads(line) for line in f if line.strip()]
+    key = (str(file), st.st_mtime_ns, st.st_size)
+    if key in _CACHE:
+        return _CACHE[key]
+    raw = file.read_bytes()
+    records = None
+    if orjson:
+        # Decode the whole file with one C-level parse: join the lines into a
+        # JSON array. JSON strings cannot contain raw newlines, so splitting
+        # on b"\n" is safe; a malformed buffer falls back to per-line parsing.
+        payload = b",".join(filter(None, raw.split(b"\n")))
+        if not payload:
+            records = []
+        else:
+            try:
+                records = orjson.loads(b"[" + payload + b"]")
+            except orjson.JSONDecodeError:
+                records = None
+    if records is None:
+        records = [_json_loads(line) for line in raw.splitlines() if line.strip()]
+    # Inlined _attach_date_fields_helper with the parser bound to a local:
+    # saves a Python call and a global lookup per record on the hot load loop.
+    fromiso = date.fromisoformat
+    for rec in records:
+        dt = rec["_dt"] = fromiso(rec["date"])
+        rec["_ym"] = (dt.year, dt.month)
+        rec["_week"] = dt.isocalendar()[1]
+    _CACHE[key] = records
+    return records
+
+def iter_expenses(file: Path = _file):
+    """
+    Yield expense records one at a time without materializing the file.
+
+    Streaming counterpart to `_loading_data_helper` for consumers that only
+    make a single pass (e.g., piping a large file through an export): memory
+    stays constant and the first record is available before the file is
+    fully parsed. Records carry the same internal date fields as loaded
+    ones. The interactive entry points keep using the cached loader, which
+    amortizes better across repeated calls in a session.
+
+    Args:
+        file (Path): Path to the file containing expense records.
 
-def _date_validation_helper(date:str) -> str:
+    Yields:
+        dict: One expense record per stored line.
+    """
+    try:
+        f = open(file, "rb")
+    except OSError:
+        return
+    with f:
+        for line in f:
+            if line.strip():
+                yield _attach_date_fields_helper(_json_loads(line))
+
+def _today_iso_helper() -> str:
+    """
+    Return today's date as an ISO 'YYYY-MM-DD' string, formatted at most
+    once per day.
+
+    Returns:
+        str: Today's date in 'YYYY-MM-DD' format.
+    """
+    today = date.today()
+    if _TODAY_CACHE[0] != today:
+        _TODAY_CACHE[:] = [today, today.isoformat()]
+    return _TODAY_CACHE[1]
+
+@lru_cache(maxsize=256)
+def _date_validation_helper(date_str:str) -> str:
     """
     Validate and parse a date string in 'YYYY-MM-DD' format.
 
     Args:
-        date (str): Date string provided by user.
+        date_str (str): Date string provided by user.
 
     Returns:
         str | bool: Returns the same date string if valid, otherwise False.
     """
+    # Shape check by slicing: strict ASCII 'YYYY-MM-DD' only, rejecting the
+    # other ISO 8601 variants that date.fromisoformat would accept. The
+    # isascii() guard matters because isdigit()/int() also accept non-ASCII
+    # digits, which the loader could never re-parse.
+    if (len(date_str) != 10 or not date_str.isascii()
+            or date_str[4] != "-" or date_str[7] != "-"
+            or not (date_str[:4] + date_str[5:7] + date_str[8:]).isdigit()):
+        return False
     try:
-        datetime.strptime(date, "%Y-%m-%d")
-        return date
+        date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
+        return date_str
     except ValueError:
         return False
 
@@ -162,8 +373,11 @@ def _enumerate_show_helper(data: list[dict]) -> None:
         data (list[dict]): List of expense entries. Each entry must have keys:
             'category', 'item', 'amount', 'date'.
     """
-    table = [(idx, e['category'], e['item'], e['amount'], e['date']) for idx, e in enumerate(data, 1)]
-    print(tabulate(table, headers=["ID", "CATEGORY", "ITEM", "AMOUNT", "DATE"]))
+    get = itemgetter('category', 'item', 'amount', 'date')
+    table = [(idx, *get(e)) for idx, e in enumerate(data, 1)]
+    # The cells are already typed; disable_numparse skips tabulate's per-cell
+    # re-detection of numeric strings.
+    print(tabulate(table, headers=["ID", "CATEGORY", "ITEM", "AMOUNT", "DATE"], disable_numparse=True))
 
 def _total_return_helper(items: list[dict]) -> tuple[int, str]:
     """
@@ -175,7 +389,7 @@ def _total_return_helper(items: list[dict]) -> tuple[int, str]:
     Returns:
         tuple: (total_items, total_amount)
     """
-    total_amount = sum(x["amount"] for x in items)
+    total_amount = sum(map(itemgetter("amount"), items))
     return (len(items), total_amount)
 
 def _ordinal_helper(n: int) -> str:
@@ -195,20 +409,66 @@ def _ordinal_helper(n: int) -> str:
     return f"{n}{suffix}"
 
 def _date_based_sorting_helper(file:Path = _file, Reverse = True) -> list:
-    return sorted(
-        _loading_data_helper(file),
-        key=lambda x: datetime.strptime(x["date"], "%Y-%m-%d"),
-        reverse=Reverse
-    )
+    file = Path(file)
+    try:
+        st = file.stat()
+    except OSError:
+        return []
+    key = (str(file), st.st_mtime_ns, st.st_size, Reverse)
+    if key not in _SORTED_CACHE:
+        # ISO date strings sort identically to the dates they encode, and
+        # itemgetter runs the key extraction in C instead of a per-element
+        # lambda frame.
+        _SORTED_CACHE[key] = sorted(
+            _loading_data_helper(file),
+            key=itemgetter("date"),
+            reverse=Reverse
+        )
+    return _SORTED_CACHE[key]
+
+def _print_report_helper(header: str, entries: list[dict]) -> None:
+    """
+    Print a report header and its entry lines with a single write.
 
-def _month_normalizer_helper(month: str|int) ->int:
-    from calendar import month_name
+    Args:
+        header (str): Report heading, including totals.
+        entries (list[dict]): Expense entries to list under the heading.
+    """
+    lines = [header]
+    lines += [
+        f"-- Category: {entry['category']:<15s} | ({entry['item']} for ${entry['amount']:,.2f}) -> {entry['date']}"
+        for entry in entries
+    ]
+    print("\n".join(lines))
 
+def _report_cache_key_helper(report_type: str, params: tuple, file: Path):
+    """
+    Build a _REPORT_CACHE key for a report over the given file.
+
+    Args:
+        report_type (str): Report kind, e.g. 'weekly', 'monthly', 'yearly'.
+        params (tuple): Report parameters, e.g. (year, week).
+        file (Path): File the report is generated from.
+
+    Returns:
+        tuple | None: Cache key, or None if the file does not exist.
+    """
+    file = Path(file)
+    try:
+        st = file.stat()
+    except OSError:
+        return None
+    return (str(file), report_type, params, st.st_mtime_ns, st.st_size)
+
+@lru_cache(maxsize=64)
+def _month_normalizer_helper(month: str|int) ->int:
     if isinstance(month, int):
         return month
     month_str = str(month).lower()
-    for i, name in enumerate(month_name):
-        if name and name.lower().startswith(month_str):
+    if month_str in _MONTHS:
+        return _MONTHS[month_str]
+    for name, i in _MONTHS.items():
+        if name.startswith(month_str):
             return i
     raise ValueError(f"Invalid month: {month}")
 
@@ -224,12 +484,18 @@ def _weekly_report_generator(year: int, week: int, file: Path = _file) -> list[d
         year (int): Year of the week.
         week (int): ISO week number (1–52).
     """
+    cache_key = _report_cache_key_helper("weekly", (year, week), file)
+    if cache_key in _REPORT_CACHE:
+        return _REPORT_CACHE[cache_key]
+
     expenses = _date_based_sorting_helper(file)
     entries = [
         e for e in expenses
-        if (dt := datetime.strptime(e['date'], '%Y-%m-%d')).year == year
-        and dt.isocalendar().week == week
+        if e["_dt"].year == year
+        and e["_week"] == week
     ]
+    if cache_key:
+        _REPORT_CACHE[cache_key] = entries
     return entries
 
 def _monthly_report_generator(year: int, month: int | str, file: Path = _file) -> list[dict]:
@@ -240,19 +506,24 @@ def _monthly_report_generator(year: int, month: int | str, file: Path = _file) -
         year (int): Year of the month.
         month (int | str): Month number (1–12) or month name (e.g., 'January').
     """
-    expenses = _date_based_sorting_helper(file)
-    monthly_report = defaultdict(list)
-    for e in expenses:
-        dt = datetime.strptime(e["date"], "%Y-%m-%d")
-        monthly_report[(dt.year, dt.month, dt.strftime('%B'))].append(e)
-    
     month = _month_normalizer_helper(month)
-    key = next(
-        (k for k in monthly_report
-        if k[0] == year and k[1] == month)
-        , None)
-    
-    return key, monthly_report[key]
+    cache_key = _report_cache_key_helper("monthly", (year, month), file)
+    if cache_key in _REPORT_CACHE:
+        return _REPORT_CACHE[cache_key]
+
+    expenses = _date_based_sorting_helper(file)
+    # The sorted view keeps each month contiguous, so one groupby pass builds
+    # the report without per-record dict lookups.
+    monthly_report = {
+        key: list(group)
+        for key, group in groupby(expenses, key=itemgetter("_ym"))
+    }
+
+    entries = monthly_report.get((year, month))
+    result = (None, []) if entries is None else ((year, month, month_name[month]), entries)
+    if cache_key:
+        _REPORT_CACHE[cache_key] = result
+    return result
 
 def _yearly_report_generator(year: int, file: Path = _file) -> list[dict]:
     """
@@ -261,11 +532,20 @@ def _yearly_report_generator(year: int, file: Path = _file) -> list[dict]:
     Args:
         year (int): Year to report.
     """
+    cache_key = _report_cache_key_helper("yearly", (year,), file)
+    if cache_key in _REPORT_CACHE:
+        return _REPORT_CACHE[cache_key]
+
     expenses = _date_based_sorting_helper(file)
+    # ISO dates start with the zero-padded year, so a C-level string prefix
+    # compare filters without touching the date objects at all.
+    prefix = f"{year:04d}-"
     entries = [
         e for e in expenses
-        if datetime.strptime(e["date"], "%Y-%m-%d").year == year
+        if e["date"].startswith(prefix)
                 ]
+    if cache_key:
+        _REPORT_CACHE[cache_key] = entries
     return entries
 
 
@@ -274,6 +554,79 @@ def _yearly_report_generator(year: int, file: Path = _file) -> list[dict]:
 # ----------------------------
 
 
+def _make_expense_helper(category: str, item: str, amount, date_str: str) -> dict:
+    """
+    Build a validated expense record from raw field values.
+
+    Applies the same rules as the interactive prompts: category and item are
+    required, the amount falls back to 0.0 when not numeric, and an invalid
+    date falls back to today.
+
+    Args:
+        category (str): Category of the expense.
+        item (str): Item or purpose of the expense.
+        amount: Expense amount; coerced to float. Non-numeric, non-finite,
+            or negative values default to 0.0.
+        date_str (str): Date in 'YYYY-MM-DD' format.
+
+    Returns:
+        dict: Expense record with keys 'category', 'item', 'amount', 'date'.
+
+    Raises:
+        ValueError: If category or item is empty.
+    """
+    category = str(category).strip()
+    item = str(item).strip()
+    if not category or not item:
+        raise ValueError("Category and Item are required.")
+
+    try:
+        amount = float(amount)
+    except (TypeError, ValueError):
+        amount = 0.0
+    # Mirror the original digit-check semantics: 'nan'/'inf' (which orjson
+    # would persist as null) and negative amounts all fall back to 0.0.
+    if not isfinite(amount) or amount < 0:
+        amount = 0.0
+
+    date_str = str(date_str).strip()
+    if date_str.lower() == "today":
+        # Documented shortcut: skip the doomed parse attempt entirely.
+        valid_date = _today_iso_helper()
+    else:
+        valid_date = _date_validation_helper(date_str)
+        if not valid_date:
+            valid_date = _today_iso_helper()
+
+    return {
+        "category": category,
+        "item": item,
+        "amount": amount,
+        "date": valid_date
+    }
+
+def add_expenses_bulk(records: list[dict], file: Path = _file) -> int:
+    """
+    Add many expenses non-interactively (e.g., imported from a CSV).
+
+    Validates each record through `_make_expense_helper` and appends them
+    all with one buffered write.
+
+    Args:
+        records (list[dict]): Raw records with keys 'category', 'item',
+            'amount', and 'date'.
+        file (Path, optional): File path to store expense data.
+
+    Returns:
+        int: Number of records written.
+    """
+    expenses = [
+        _make_expense_helper(rec["category"], rec["item"], rec.get("amount", 0.0), rec.get("date", ""))
+        for rec in records
+    ]
+    _batch_saving_helper(expenses, file)
+    return len(expenses)
+
 def add_expense(file = _file):
     """
     Interactively add a new expense entry.
@@ -282,9 +635,17 @@ def add_expense(file = _file):
     - Validates required fields and the date format.
     - Uses today's date if the input date is invalid.
     - Converts the amount to float safely.
-    - Saves the expense to the file using `_file_saving_helper`.
-    - Recursively allows adding multiple expenses in one session.
+    - Buffers entries for the session and saves them in one batch write
+      using `_batch_saving_helper`.
+    - Loops iteratively to allow adding multiple expenses in one session.
     """
+    buffered = []
+    try:
+        _add_expense_loop(buffered)
+    finally:
+        _batch_saving_helper(buffered, file)
+
+def _add_expense_loop(buffered: list[dict]) -> None:
     while True:
         print("\nAll fields are required...")
         
@@ -293,25 +654,16 @@ def add_expense(file = _file):
         amount_input = input("Enter the expense amount *: ").strip() or "0"
         date_input = input("Enter the expense date (YYYY-MM-DD or 'Today') *: ").strip()
         
-        if not category or not item:
+        try:
+            expense_data = _make_expense_helper(category, item, amount_input, date_input)
+        except ValueError:
             print("Category and Item are required. Please try again.")
             continue
-        
-        amount = float(amount_input) if amount_input.replace(".", "", 1).isdigit() else 0.0
-        date = _date_validation_helper(date_input)
-        if not date:
+        if expense_data["date"] != date_input and date_input.lower() != "today":
             print("Invalid date format. Using today's date instead.")
-            date = datetime.today().date().strftime("%Y-%m-%d")
-        
-        expense_data = {
-            "category": category,
-            "item": item,
-            "amount": amount,
-            "date": date
-        }
-        
-        _file_saving_helper(expense_data, file)
-        print(f"Expense added: {category}, {item}, {amount}, {date}\n")
+
+        buffered.append(expense_data)
+        print(f"Expense added: {expense_data['category']}, {expense_data['item']}, {expense_data['amount']}, {expense_data['date']}\n")
         
         more_input = input("Do you want to add more? (y/n): ").strip().lower()
         if more_input not in ("y", "yes"):
@@ -331,7 +683,7 @@ def view_expense(file=_file):
     expenses = _loading_data_helper(file)
     _enumerate_show_helper(expenses)
 
-    total_amount = sum(item["amount"] for item in expenses)
+    total_amount = sum(map(itemgetter("amount"), expenses))
     print(f"\nTotal items: {len(expenses)}")
     print(f"Total expense: {total_amount:,.2f}")
 
@@ -354,7 +706,7 @@ def update_expense(file=_file):
     while True:
         try:
             idx = int(input("\nEnter ID to update: "))
-            if idx < 1 or idx > len(expenses):
+            if not (1 <= idx <= len(expenses)):
                 print("Invalid ID.")
                 return
         except ValueError:
@@ -393,15 +745,19 @@ def categorize_expense(file=_file):
         file (Path, optional): File path containing expense records.
     """
     expenses = _loading_data_helper(file)
-    categorized = {}
-    for e in expenses:
-        categorized.setdefault(e["category"], []).append(e)
-
-    for category, items in categorized.items():
-        print(f"\nCategory Name: {category}")
-        print("Items on this category:")
+    # Sorting by category makes each group contiguous, so one C-level
+    # groupby pass replaces the per-record setdefault/append dict churn.
+    by_category = itemgetter("category")
+    # Accumulate the report and emit it with one write instead of a buffered
+    # write per line.
+    out = []
+    for category, items in groupby(sorted(expenses, key=by_category), key=by_category):
+        out.append(f"\nCategory Name: {category}")
+        out.append("Items on this category:")
         for item in items:
-            print(f"  - {item['item']} (Amount: {item['amount']}, Date: {item['date']})")
+            out.append(f"  - {item['item']} (Amount: {item['amount']}, Date: {item['date']})")
+    if out:
+        print("\n".join(out))
 
 def generate_summary(file=_file):
     """
@@ -409,7 +765,7 @@ def generate_summary(file=_file):
 
     - Loads all expenses from the file.
     - Sorts expenses by date descending.
-    - Groups expenses into weekly, monthly, and yearly reports using defaultdict.
+    - Groups expenses into weekly, monthly, and yearly reports using groupby.
     - Provides interactive selection of report type and specific time period.
     - Displays totals and formatted entries per report.
 
@@ -430,9 +786,7 @@ def generate_summary(file=_file):
                     print(f"No expense recorded for week {week} of {year}.")
                     return
                 total_item, total_amount = _total_return_helper(entries)
-                print(f"Weekly report for {_ordinal_helper(week)} week of {year} -> (Total items: {total_item}, Total amount: ${total_amount:,.2f}) :")
-                for entry in entries:
-                    print(f"-- Category: {entry['category']:<15s} | ({entry['item']} for ${entry['amount']:,.2f}) -> {entry['date']}")
+                _print_report_helper(f"Weekly report for {_ordinal_helper(week)} week of {year} -> (Total items: {total_item}, Total amount: ${total_amount:,.2f}) :", entries)
 
             case '2':
                 year = int(input('Enter the year: ').strip())
@@ -443,9 +797,7 @@ def generate_summary(file=_file):
                     print(f"No expense recorded for {month} month of {year}.")
                     return
                 total_item, total_amount = _total_return_helper(entries)
-                print(f"Monthly report for {key} -> (Total items: {total_item}, Total amount: ${total_amount:,.2f}) :")
-                for entry in entries:
-                    print(f"-- Category: {entry['category']:<15s} | ({entry['item']} for ${entry['amount']:,.2f}) -> {entry['date']}")
+                _print_report_helper(f"Monthly report for {key} -> (Total items: {total_item}, Total amount: ${total_amount:,.2f}) :", entries)
 
             case '3':
                 year = int(input('Enter the year: ').strip())
@@ -454,9 +806,7 @@ def generate_summary(file=_file):
                     print(f"No expense recorded for year {year}.")
                     return
                 total_item, total_amount = _total_return_helper(entries)
-                print(f"Yearly report for {year} -> (Total items: {total_item}, Total amount: ${total_amount:,.2f}) :")
-                for entry in entries:
-                    print(f"-- Category: {entry['category']:<15s} | ({entry['item']} for ${entry['amount']:,.2f}) -> {entry['date']}")
+                _print_report_helper(f"Yearly report for {year} -> (Total items: {total_item}, Total amount: ${total_amount:,.2f}) :", entries)
 
             case _:
                 print('Invalid choice. No summary.')